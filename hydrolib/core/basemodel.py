@@ -10,6 +10,7 @@ from abc import ABC, abstractclassmethod, abstractmethod
 from contextlib import contextmanager
 from contextvars import ContextVar
 from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 from weakref import WeakValueDictionary
@@ -928,6 +929,7 @@ class DiskOnlyFileModel(FileModel):
         return self.filepath is not None
 
 
+@lru_cache(maxsize=None)
 def validator_set_default_disk_only_file_model_when_none() -> classmethod:
     """Validator to ensure a default empty DiskOnlyFileModel is created
     when the corresponding field is initialized with None.
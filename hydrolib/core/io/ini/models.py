@@ -87,12 +87,10 @@ class INIBasedModel(BaseModel, ABC):
     @root_validator(pre=True)
     def _skip_nones_and_set_header(cls, values):
         """Drop None fields for known fields."""
-        dropkeys = []
-        for k, v in values.items():
-            if v is None and k in cls.__fields__.keys():
-                dropkeys.append(k)
+        fields = cls.__fields__
+        dropkeys = [k for k, v in values.items() if v is None and k in fields]
 
-        logger.info(f"Dropped unset keys: {dropkeys}")
+        logger.info("Dropped unset keys: %s", dropkeys)
         for k in dropkeys:
             values.pop(k)
 
@@ -134,13 +132,15 @@ class INIBasedModel(BaseModel, ABC):
 
     def _to_section(self) -> Section:
         props = []
+        exclude_fields = self._exclude_fields()
+        fields = self.__fields__
         for key, value in self:
-            if key in self._exclude_fields():
+            if key in exclude_fields:
                 continue
 
             field_key = key
-            if key in self.__fields__:
-                key = self.__fields__[key].alias
+            if key in fields:
+                key = fields[key].alias
 
             prop = Property(
                 key=key,
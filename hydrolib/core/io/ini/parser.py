@@ -8,6 +8,11 @@ from pydantic import validator
 from hydrolib.core.basemodel import BaseModel
 from hydrolib.core.io.ini.io_models import CommentBlock, Document, Property, Section
 
+# Matches whole line: "Field = Value Maybe more # optional comment"
+_PROG_LINE = re.compile(r"^([^#]*=\s*)([^#]*)(#.*)?")
+# Matches a float value: 1d9, 1D-3, 1.D+4, etc.
+_PROG_FLOAT = re.compile(r"([\d.]+)([dD])([+\-]?\d+)")
+
 
 class ParserConfig(BaseModel):
     """ParserConfig defines the configuration options of the Parser
@@ -367,26 +372,19 @@ class Parser:
             config = ParserConfig()
         parser = cls(config)
 
-        progline = re.compile(
-            r"^([^#]*=\s*)([^#]*)(#.*)?"
-        )  # matches whole line: "Field = Value Maybe more # optional comment"
-        progfloat = re.compile(
-            r"([\d.]+)([dD])([+\-]?\d+)"
-        )  # matches a float value: 1d9, 1D-3, 1.D+4, etc.
-
         with filepath.open() as f:
             for line in f:
                 # Replace Fortran scientific notation for doubles
                 # Match number d/D +/- number (e.g. 1d-05 or 1.23D+01 or 1.d-4)
-                match = progline.match(line)
+                match = _PROG_LINE.match(line)
                 if match:  # Only process value
                     line = (
                         match.group(1)
-                        + progfloat.sub(r"\1e\3", match.group(2))
+                        + _PROG_FLOAT.sub(r"\1e\3", match.group(2))
                         + str(match.group(3) or "")
                     )
                 else:  # Process full line
-                    line = progfloat.sub(r"\1e\3", line)
+                    line = _PROG_FLOAT.sub(r"\1e\3", line)
 
                 parser.feed_line(line)
 
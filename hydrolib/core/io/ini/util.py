@@ -1,16 +1,18 @@
 """util.py provides additional utility methods related to handling ini files.
 """
 from enum import Enum
+from functools import lru_cache
 from operator import eq
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from pydantic.class_validators import root_validator, validator
 from pydantic.fields import ModelField
 from pydantic.main import BaseModel
 
-from hydrolib.core.utils import operator_str, str_is_empty_or_none
+from hydrolib.core.utils import operator_str, str_is_empty_or_none, to_list
 
 
+@lru_cache(maxsize=None)
 def get_split_string_on_delimiter_validator(*field_name: str):
     """Get a validator to split strings passed to the specified field_name.
 
@@ -27,13 +29,19 @@ def get_split_string_on_delimiter_validator(*field_name: str):
 
     def split(cls, v: Any, field: ModelField):
         if isinstance(v, str):
-            v = v.split(cls.get_list_field_delimiter(field.name))
+            v = v.split(_get_list_field_delimiter(cls, field.name))
             v = [item.strip() for item in v if item != ""]
         return v
 
     return validator(*field_name, allow_reuse=True, pre=True)(split)
 
 
+@lru_cache(maxsize=None)
+def _get_list_field_delimiter(cls: Type[BaseModel], field_name: str) -> str:
+    return cls.get_list_field_delimiter(field_name)
+
+
+@lru_cache(maxsize=None)
 def get_enum_validator(*field_name: str, enum: Type[Enum]):
     """
     Get a case-insensitive enum validator that will returns the corresponding enum value.
@@ -43,24 +51,25 @@ def get_enum_validator(*field_name: str, enum: Type[Enum]):
         enum (Type[Enum]): The enum type for which to validate.
     """
 
+    entries: Dict[str, Enum] = {}
+    for entry in enum.__members__.values():
+        entries.setdefault(entry.lower(), entry)
+
     def get_enum(v):
-        for entry in enum:
-            if entry.lower() == v.lower():
+        if isinstance(v, str):
+            # Most input is already lowercase, so try that before lowercasing.
+            if (entry := entries.get(v)) is not None:
                 return entry
+            return entries.get(v.lower(), v)
         return v
 
     return validator(*field_name, allow_reuse=True, pre=True, each_item=True)(get_enum)
 
 
+@lru_cache(maxsize=None)
 def make_list_validator(*field_name: str):
     """Get a validator make a list of object if a single object is passed."""
-
-    def split(v: Any):
-        if not isinstance(v, list):
-            v = [v]
-        return v
-
-    return validator(*field_name, allow_reuse=True, pre=True)(split)
+    return validator(*field_name, allow_reuse=True, pre=True)(to_list)
 
 
 def make_list_length_root_validator(
@@ -84,18 +93,14 @@ def make_list_length_root_validator(
             For example, to require list length 1 when length value is given as 0.
     """
 
-    def _get_incorrect_length_validation_message() -> str:
-        """Make a string with a validation message, ready to be format()ed with
-        field name and length name."""
-        incrstring = f" + {length_incr}" if length_incr != 0 else ""
-        minstring = f" (and at least {min_length})" if min_length > 0 else ""
-
-        return (
-            "Number of values for {} should be equal to the {} value"
-            + incrstring
-            + minstring
-            + "."
-        )
+    incrstring = f" + {length_incr}" if length_incr != 0 else ""
+    minstring = f" (and at least {min_length})" if min_length > 0 else ""
+    incorrect_length_message = (
+        "Number of values for {} should be equal to the {} value"
+        + incrstring
+        + minstring
+        + "."
+    )
 
     def _validate_listfield_length(
         field_name: str, field: Optional[List[Any]], requiredlength: int
@@ -103,11 +108,7 @@ def make_list_length_root_validator(
         """Validate the length of a single field, which should be a list."""
 
         if field is not None and len(field) != requiredlength:
-            raise ValueError(
-                _get_incorrect_length_validation_message().format(
-                    field_name, length_name
-                )
-            )
+            raise ValueError(incorrect_length_message.format(field_name, length_name))
         if field is None and list_required_with_length and requiredlength > 0:
             raise ValueError(
                 f"List {field_name} cannot be missing if {length_name} is given."
@@ -152,21 +153,15 @@ def get_forbidden_fields_validator(
         comparison_func (Callable): binary operator function, used to override the default "eq" check for the conditional field value.
     """
 
-    def validate_forbidden_fields(cls, values: dict):
-        if (val := values.get(conditional_field_name)) is None or not comparison_func(
-            val, conditional_value
-        ):
-            return values
-
-        for field in field_names:
-            if values.get(field) != None:
-                raise ValueError(
-                    f"{field} is forbidden when {conditional_field_name} {operator_str(comparison_func)} {conditional_value}"
-                )
-
-        return values
-
-    return root_validator(allow_reuse=True)(validate_forbidden_fields)
+    return _get_conditional_fields_validator(
+        field_names,
+        conditional_field_name,
+        conditional_value,
+        comparison_func,
+        kind="forbidden",
+        is_invalid=lambda value: value is not None,
+        message="{} is forbidden when {}",
+    )
 
 
 def get_required_fields_validator(
@@ -186,21 +181,53 @@ def get_required_fields_validator(
         comparison_func (Callable): binary operator function, used to override the default "eq" check for the conditional field value.
     """
 
-    def validate_required_fields(cls, values: dict):
+    return _get_conditional_fields_validator(
+        field_names,
+        conditional_field_name,
+        conditional_value,
+        comparison_func,
+        kind="required",
+        is_invalid=lambda value: value is None,
+        message="{} should be provided when {}",
+    )
+
+
+def _get_conditional_fields_validator(
+    field_names: Tuple[str, ...],
+    conditional_field_name: str,
+    conditional_value: Any,
+    comparison_func: Callable[[Any, Any], bool],
+    kind: str,
+    is_invalid: Callable[[Any], bool],
+    message: str,
+):
+    """
+    Gets a validator that checks each of the fields with `is_invalid`, if
+    `conditional_field_name` compares to `conditional_value`. Shared implementation
+    of the forbidden and required fields validators.
+    """
+    condition = (
+        f"{conditional_field_name} {operator_str(comparison_func)} {conditional_value}"
+    )
+
+    def validate_conditional_fields(cls, values: dict):
         if (val := values.get(conditional_field_name)) is None or not comparison_func(
             val, conditional_value
         ):
             return values
 
         for field in field_names:
-            if values.get(field) == None:
-                raise ValueError(
-                    f"{field} should be provided when {conditional_field_name} {operator_str(comparison_func)} {conditional_value}"
-                )
+            if is_invalid(values.get(field)):
+                raise ValueError(message.format(field, condition))
 
         return values
 
-    return root_validator(allow_reuse=True)(validate_required_fields)
+    # Pydantic drops root validators that share a name, so give each one its own.
+    validate_conditional_fields.__name__ = (
+        f"validate_{kind}_fields_{conditional_field_name}_{'_'.join(field_names)}"
+    )
+
+    return root_validator(allow_reuse=True)(validate_conditional_fields)
 
 
 def get_conditional_root_validator(
@@ -232,6 +259,11 @@ def get_conditional_root_validator(
     return root_validator(allow_reuse=True)(validate_conditionally)
 
 
+_subclass_defaults: Dict[
+    Tuple[Type[BaseModel], str], Tuple[Tuple[Type[BaseModel], ...], Dict[str, Any]]
+] = {}
+
+
 def get_from_subclass_defaults(cls: Type[BaseModel], fieldname: str, value: str):
     """Gets a value that corresponds with the default field value of one of the subclasses.
 
@@ -243,12 +275,32 @@ def get_from_subclass_defaults(cls: Type[BaseModel], fieldname: str, value: str)
     Returns:
         [type]: The field default that corresponds to the value.
     """
-    for c in cls.__subclasses__():
+    subclasses = tuple(cls.__subclasses__())
+    cached = _subclass_defaults.get((cls, fieldname))
+    if cached is None or cached[0] != subclasses:
+        # (Re)build the mapping when the subclasses changed since the last call.
+        cached = (subclasses, _get_subclass_defaults(subclasses, fieldname))
+        _subclass_defaults[(cls, fieldname)] = cached
+
+    return cached[1].get(value.lower(), value)
+
+
+def _get_subclass_defaults(
+    subclasses: Tuple[Type[BaseModel], ...], fieldname: str
+) -> Dict[str, Any]:
+    # The first subclass with a given default wins.
+    defaults: Dict[str, Any] = {}
+    for c in subclasses:
         default = c.__fields__.get(fieldname).default
-        if default.lower() == value.lower():
-            return default
+        if default is not None:
+            defaults.setdefault(default.lower(), default)
 
-    return value
+    return defaults
+
+
+def _validate_coordinates_given(values: Dict, coord_key: str, coord_name: str) -> None:
+    if values.get(coord_key, None) is None:
+        raise ValueError("{} should be given.".format(coord_name))
 
 
 def get_location_specification_rootvalidator(
@@ -278,6 +330,12 @@ def get_location_specification_rootvalidator(
 
     """
 
+    numfield_key = (
+        numfield_name.lower() if not str_is_empty_or_none(numfield_name) else None
+    )
+    xfield_key = xfield_name.lower()
+    yfield_key = yfield_name.lower()
+
     def validate_location_specification(cls, values: Dict) -> Dict:
         """
         Verify whether the location given for this object matches the expectations.
@@ -294,38 +352,25 @@ def get_location_specification_rootvalidator(
             Dict: Validated dictionary of input class fields.
         """
 
-        def validate_coordinates(coord_name: str) -> None:
-            if values.get(coord_name.lower(), None) is None:
-                raise ValueError("{} should be given.".format(coord_name))
-
         # If nodeid or branchid and Chainage are present
         node_id: str = values.get("nodeid", None)
         branch_id: str = values.get("branchid", None)
         n_coords: int = (
-            values.get(numfield_name.lower(), 0)
-            if not str_is_empty_or_none(numfield_name)
-            else None
+            values.get(numfield_key, 0) if numfield_key is not None else None
         )
 
         chainage: float = values.get("chainage", None)
 
-        # First validation - at least one of the following should be specified.
-        if str_is_empty_or_none(node_id) and (str_is_empty_or_none(branch_id)):
-            if n_coords == 0:
-                raise ValueError(
-                    f"Either {'nodeId, ' if allow_nodeid else ''}branchId (with chainage) or {numfield_name + ' with ' if numfield_name else ''}{xfield_name} and {yfield_name} are required."
-                )
-            else:
-                # Validation: when ids are absent, coordinates should be valid.
-                validate_coordinates(xfield_name)
-                validate_coordinates(yfield_name)
-            return values
-        else:
+        has_node_id = not str_is_empty_or_none(node_id)
+        has_branch_id = not str_is_empty_or_none(branch_id)
+
+        # Most objects are located by nodeId or branchId, so check that first.
+        if has_node_id or has_branch_id:
             # Validation: nodeId only when it is allowed
-            if not str_is_empty_or_none(node_id) and not allow_nodeid:
+            if has_node_id and not allow_nodeid:
                 raise ValueError(f"nodeId is not allowed for {cls.__name__} objects")
             # Validation: chainage should be given with branchid
-            if not str_is_empty_or_none(branch_id) and chainage is None:
+            if has_branch_id and chainage is None:
                 raise ValueError(
                     "Chainage should be provided when branchId is specified."
                 )
@@ -337,6 +382,15 @@ def get_location_specification_rootvalidator(
                 raise ValueError(
                     "locationType should be 1d when nodeId (or branchId and chainage) is specified."
                 )
+        # Otherwise, at least the coordinates should be specified.
+        elif n_coords == 0:
+            raise ValueError(
+                f"Either {'nodeId, ' if allow_nodeid else ''}branchId (with chainage) or {numfield_name + ' with ' if numfield_name else ''}{xfield_name} and {yfield_name} are required."
+            )
+        else:
+            # Validation: when ids are absent, coordinates should be valid.
+            _validate_coordinates_given(values, xfield_key, xfield_name)
+            _validate_coordinates_given(values, yfield_key, yfield_name)
 
         return values
 
@@ -365,6 +419,11 @@ def get_number_of_coordinates_validator(
             coordinates required in order to validate. Defaults to 0.
     """
 
+    numfield_key, xfield_key, yfield_key = (
+        name.lower() if not str_is_empty_or_none(name) else None
+        for name in (numfield_name, xfield_name, yfield_name)
+    )
+
     def validate_number_of_coordinates(cls, values: Dict) -> Dict:
         """
         Validates whether the given coordinates match in number to the
@@ -387,54 +446,36 @@ def get_number_of_coordinates_validator(
             Dict: Validated dictionary of input class fields.
         """
 
-        def get_value(field_name: str) -> Any:
-            return (
-                values.get(field_name.lower(), None)
-                if not str_is_empty_or_none(field_name)
-                else None
-            )
-
-        def all_values_are_none() -> bool:
-            return (
-                number_of_coordinates is None
-                and xcoordinates is None
-                and ycoordinates is None
-            )
-
-        def some_values_are_none() -> bool:
-            return (
-                number_of_coordinates is None
-                or xcoordinates is None
-                or ycoordinates is None
-            )
-
-        def validate_x_and_ycoordinate_number() -> None:
-            number_of_xcoordinates = len(xcoordinates)
-            number_of_ycoordinates = len(ycoordinates)
-
-            if (
-                number_of_xcoordinates != number_of_coordinates
-                or number_of_ycoordinates != number_of_coordinates
-                or number_of_xcoordinates < minimum_required_number_of_coordinates
-            ):
-                raise ValueError(
-                    f"Number of x-coordinates and y-coordinates should match number of"
-                    "coordinates and should be atleast {minimum_required_number_of_coordinates}."
-                )
+        number_of_coordinates = values.get(numfield_key)
+        xcoordinates = values.get(xfield_key)
+        ycoordinates = values.get(yfield_key)
 
-        number_of_coordinates = get_value(numfield_name)
-        xcoordinates = get_value(xfield_name)
-        ycoordinates = get_value(yfield_name)
-
-        if all_values_are_none():
+        if (
+            number_of_coordinates is None
+            and xcoordinates is None
+            and ycoordinates is None
+        ):
             return values
 
-        if some_values_are_none():
+        if (
+            number_of_coordinates is None
+            or xcoordinates is None
+            or ycoordinates is None
+        ):
             raise ValueError(
                 f"When using coordinates, the fields {numfield_name}, {xfield_name} and {yfield_name} should be given."
             )
 
-        validate_x_and_ycoordinate_number()
+        number_of_xcoordinates = len(xcoordinates)
+        if (
+            number_of_xcoordinates != number_of_coordinates
+            or len(ycoordinates) != number_of_coordinates
+            or number_of_xcoordinates < minimum_required_number_of_coordinates
+        ):
+            raise ValueError(
+                f"Number of x-coordinates and y-coordinates should match number of"
+                "coordinates and should be atleast {minimum_required_number_of_coordinates}."
+            )
 
         return values
 
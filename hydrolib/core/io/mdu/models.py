@@ -1,6 +1,7 @@
 from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Mapping, Optional, Union
 
 from pydantic import Field
 
@@ -23,6 +24,14 @@ from hydrolib.core.io.storagenode.models import StorageNodeModel
 from hydrolib.core.io.structure.models import StructureModel
 from hydrolib.core.io.xyz.models import XYZModel
 
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_disk_only_file_model() -> DiskOnlyFileModel:
+    # A new object for every field, as file models are mutable. Without a
+    # filepath there is nothing to load or validate, so construct it directly.
+    return DiskOnlyFileModel.construct()
+
 
 class General(INIGeneral):
     _header: Literal["General"] = "General"
@@ -146,10 +155,10 @@ class Sediment(INIBasedModel):
     _header: Literal["Sediment"] = "Sediment"
     sedimentmodelnr: Optional[int] = Field(alias="Sedimentmodelnr")
     morfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="MorFile"
+        default_factory=_empty_disk_only_file_model, alias="MorFile"
     )
     sedfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="SedFile"
+        default_factory=_empty_disk_only_file_model, alias="SedFile"
     )
 
 
@@ -165,9 +174,11 @@ class Wind(INIBasedModel):
 
     _header: Literal["Wind"] = "Wind"
     icdtyp: int = Field(2, alias="icdTyp")
-    cdbreakpoints: List[float] = Field([0.00063, 0.00723], alias="cdBreakpoints")
+    cdbreakpoints: List[float] = Field(
+        default_factory=lambda: [0.00063, 0.00723], alias="cdBreakpoints"
+    )
     windspeedbreakpoints: List[float] = Field(
-        [0.0, 100.0], alias="windSpeedBreakpoints"
+        default_factory=lambda: [0.0, 100.0], alias="windSpeedBreakpoints"
     )
     rhoair: float = Field(1.205, alias="rhoAir")
     relativewind: float = Field(0.0, alias="relativeWind")
@@ -240,7 +251,7 @@ class Restart(INIBasedModel):
 
     _header: Literal["Restart"] = "Restart"
     restartfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="restartFile"
+        default_factory=_empty_disk_only_file_model, alias="restartFile"
     )
     restartdatetime: Optional[str] = Field(None, alias="restartDateTime")
 
@@ -261,7 +272,7 @@ class ExternalForcing(INIBasedModel):
 
     _header: Literal["External Forcing"] = "External Forcing"
     extforcefile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="extForceFile"
+        default_factory=_empty_disk_only_file_model, alias="extForceFile"
     )
     extforcefilenew: Optional[ExtModel] = Field(None, alias="extForceFileNew")
     rainfall: Optional[bool] = Field(None, alias="rainfall")
@@ -333,20 +344,22 @@ class Output(INIBasedModel):
     outputdir: Optional[Path] = Field(None, alias="outputDir")
     waqoutputdir: Optional[Path] = Field(None, alias="waqOutputDir")
     flowgeomfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="flowGeomFile"
+        default_factory=_empty_disk_only_file_model, alias="flowGeomFile"
     )
     obsfile: Optional[List[ObservationPointModel]] = Field(None, alias="obsFile")
     crsfile: Optional[List[DiskOnlyFileModel]] = Field(None, alias="crsFile")
     hisfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="hisFile"
+        default_factory=_empty_disk_only_file_model, alias="hisFile"
     )
-    hisinterval: List[float] = Field([300], alias="hisInterval")
-    xlsinterval: List[float] = Field([0.0], alias="xlsInterval")
+    hisinterval: List[float] = Field(default_factory=lambda: [300], alias="hisInterval")
+    xlsinterval: List[float] = Field(default_factory=lambda: [0.0], alias="xlsInterval")
     mapfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="mapFile"
+        default_factory=_empty_disk_only_file_model, alias="mapFile"
     )
-    mapinterval: List[float] = Field([1200.0], alias="mapInterval")
-    rstinterval: List[float] = Field([0.0], alias="rstInterval")
+    mapinterval: List[float] = Field(
+        default_factory=lambda: [1200.0], alias="mapInterval"
+    )
+    rstinterval: List[float] = Field(default_factory=lambda: [0.0], alias="rstInterval")
     mapformat: int = Field(4, alias="mapFormat")
     ncformat: int = Field(3, alias="ncFormat")
     ncnounlimited: bool = Field(False, alias="ncNoUnlimited")
@@ -426,19 +439,29 @@ class Output(INIBasedModel):
     )
     wrimap_flow_analysis: bool = Field(False, alias="wrimap_flow_analysis")
     mapoutputtimevector: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="mapOutputTimeVector"
+        default_factory=_empty_disk_only_file_model, alias="mapOutputTimeVector"
     )
     fullgridoutput: bool = Field(False, alias="fullGridOutput")
     eulervelocities: bool = Field(False, alias="eulerVelocities")
     classmapfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="classMapFile"
-    )
-    waterlevelclasses: List[float] = Field([0.0], alias="waterLevelClasses")
-    waterdepthclasses: List[float] = Field([0.0], alias="waterDepthClasses")
-    classmapinterval: List[float] = Field([0.0], alias="classMapInterval")
-    waqinterval: List[float] = Field([0.0], alias="waqInterval")
-    statsinterval: List[float] = Field([0.0], alias="statsInterval")
-    timingsinterval: List[float] = Field([0.0], alias="timingsInterval")
+        default_factory=_empty_disk_only_file_model, alias="classMapFile"
+    )
+    waterlevelclasses: List[float] = Field(
+        default_factory=lambda: [0.0], alias="waterLevelClasses"
+    )
+    waterdepthclasses: List[float] = Field(
+        default_factory=lambda: [0.0], alias="waterDepthClasses"
+    )
+    classmapinterval: List[float] = Field(
+        default_factory=lambda: [0.0], alias="classMapInterval"
+    )
+    waqinterval: List[float] = Field(default_factory=lambda: [0.0], alias="waqInterval")
+    statsinterval: List[float] = Field(
+        default_factory=lambda: [0.0], alias="statsInterval"
+    )
+    timingsinterval: List[float] = Field(
+        default_factory=lambda: [0.0], alias="timingsInterval"
+    )
     richardsononoutput: bool = Field(True, alias="richardsonOnOutput")
 
     _split_to_list = get_split_string_on_delimiter_validator(
@@ -487,7 +510,7 @@ class Geometry(INIBasedModel):
     )
     inifieldfile: Optional[IniFieldModel] = Field(None, alias="iniFieldFile")
     waterlevinifile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="waterLevIniFile"
+        default_factory=_empty_disk_only_file_model, alias="waterLevIniFile"
     )
     landboundaryfile: Optional[List[DiskOnlyFileModel]] = Field(
         None, alias="landBoundaryFile"
@@ -504,19 +527,19 @@ class Geometry(INIBasedModel):
     crosslocfile: Optional[CrossLocModel] = Field(None, alias="crossLocFile")
     storagenodefile: Optional[StorageNodeModel] = Field(None, alias="storageNodeFile")
     oned2dlinkfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="1d2dLinkFile"
+        default_factory=_empty_disk_only_file_model, alias="1d2dLinkFile"
     )
     proflocfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="profLocFile"
+        default_factory=_empty_disk_only_file_model, alias="profLocFile"
     )
     profdeffile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="profDefFile"
+        default_factory=_empty_disk_only_file_model, alias="profDefFile"
     )
     profdefxyzfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="profDefXyzFile"
+        default_factory=_empty_disk_only_file_model, alias="profDefXyzFile"
     )
     manholefile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="manholeFile"
+        default_factory=_empty_disk_only_file_model, alias="manholeFile"
     )
     partitionfile: Optional[PolyFile] = Field(None, alias="partitionFile")
     uniformwidth1d: float = Field(2.0, alias="uniformWidth1D")
@@ -576,10 +599,10 @@ class Calibration(INIBasedModel):
     _header: Literal["Calibration"] = "Calibration"
     usecalibration: bool = Field(False, alias="UseCalibration")
     definitionfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="DefinitionFile"
+        default_factory=_empty_disk_only_file_model, alias="DefinitionFile"
     )
     areafile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="AreaFile"
+        default_factory=_empty_disk_only_file_model, alias="AreaFile"
     )
 
 
@@ -650,14 +673,14 @@ class Processes(INIBasedModel):
     _header: Literal["Processes"] = "Processes"
 
     substancefile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="SubstanceFile"
+        default_factory=_empty_disk_only_file_model, alias="SubstanceFile"
     )
     additionalhistoryoutputfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None),
+        default_factory=_empty_disk_only_file_model,
         alias="AdditionalHistoryOutputFile",
     )
     statisticsfile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="StatisticsFile"
+        default_factory=_empty_disk_only_file_model, alias="StatisticsFile"
     )
     thetavertical: Optional[float] = Field(0.0, alias="ThetaVertical")
     dtprocesses: Optional[float] = Field(0.0, alias="DtProcesses")
@@ -698,7 +721,7 @@ class Particles(INIBasedModel):
 
     particlesfile: Optional[XYZModel] = Field(None, alias="ParticlesFile")
     particlesreleasefile: DiskOnlyFileModel = Field(
-        default_factory=lambda: DiskOnlyFileModel(None), alias="ParticlesReleaseFile"
+        default_factory=_empty_disk_only_file_model, alias="ParticlesReleaseFile"
     )
     addtracer: Optional[bool] = Field(False, alias="AddTracer")
     starttime: Optional[float] = Field(0.0, alias="StartTime")
@@ -788,10 +811,12 @@ class FMModel(INIModel):
         # the mdu file. As such we need to explicitly set the resolve mode to ToAnchor
         # when this attribute is set.
 
-        if not hasattr(self, "general") or self.general is None:
+        # general is not set yet while the model is still being initialized.
+        general = self.__dict__.get("general")
+        if general is None:
             return ResolveRelativeMode.ToParent
 
-        if self.general.pathsrelativetoparent:
+        if general.pathsrelativetoparent:
             return ResolveRelativeMode.ToParent
         else:
             return ResolveRelativeMode.ToAnchor
@@ -811,12 +836,7 @@ class FMModel(INIModel):
         Returns:
             ResolveRelativeMode: The ResolveRelativeMode of this FileModel
         """
-        if not (general := data.get("general", None)):
-            return ResolveRelativeMode.ToParent
-        if not (relative_to_parent := general.get("pathsrelativetoparent", None)):
-            return ResolveRelativeMode.ToParent
-
-        if relative_to_parent == "0":
+        general = data.get("general") or _EMPTY_DATA
+        if general.get("pathsrelativetoparent") == "0":
             return ResolveRelativeMode.ToAnchor
-        else:
-            return ResolveRelativeMode.ToParent
+        return ResolveRelativeMode.ToParent
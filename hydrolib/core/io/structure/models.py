@@ -74,8 +74,8 @@ class Structure(INIBasedModel):
     xcoordinates: Optional[List[float]] = Field(None, alias="xCoordinates")
     ycoordinates: Optional[List[float]] = Field(None, alias="yCoordinates")
 
-    _loc_coord_fields = {"numcoordinates", "xcoordinates", "ycoordinates"}
-    _loc_branch_fields = {"branchid", "chainage"}
+    _loc_coord_fields = frozenset({"numcoordinates", "xcoordinates", "ycoordinates"})
+    _loc_branch_fields = frozenset({"branchid", "chainage"})
     _loc_all_fields = _loc_coord_fields | _loc_branch_fields
 
     _split_to_list = get_split_string_on_delimiter_validator(
@@ -183,13 +183,9 @@ class Structure(INIBasedModel):
                 f"Expected at least 2 coordinates, but only {n_coords} declared."
             )
 
-        def get_coord_len(coord: str) -> int:
-            if values[coord] is None:
-                return 0
-            return len(values[coord])
-
-        len_x_coords = get_coord_len("xcoordinates")
-        len_y_coords = get_coord_len("ycoordinates")
+        # The coordinates are known to be given at this point.
+        len_x_coords = len(values["xcoordinates"])
+        len_y_coords = len(values["ycoordinates"])
         if n_coords == len_x_coords == len_y_coords:
             return True
         raise ValueError(
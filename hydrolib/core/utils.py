@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from operator import eq, ge, gt, le, lt, ne
 from typing import Any, Callable, List, Optional
 
@@ -16,6 +17,23 @@ def example(a: float, b: float = 1.0) -> float:
     return a * b
 
 
+_LEADING_DIGITS = re.compile(r"^\d+")
+_DIGIT_NAMES = {
+    "0": "zero",
+    "1": "one",
+    "2": "two",
+    "3": "three",
+    "4": "four",
+    "5": "five",
+    "6": "six",
+    "7": "seven",
+    "8": "eight",
+    "9": "nine",
+}
+
+
+# The same keys occur over and over again when parsing files, so cache them.
+@lru_cache(maxsize=4096)
 def to_key(string: str) -> str:
     """
     Construct a key name from a given field name.
@@ -28,22 +46,10 @@ def to_key(string: str) -> str:
     """
     # First replace any leading digits, because those are undesirable
     # in variable names.
-    digitdict = {
-        "0": "zero",
-        "1": "one",
-        "2": "two",
-        "3": "three",
-        "4": "four",
-        "5": "five",
-        "6": "six",
-        "7": "seven",
-        "8": "eight",
-        "9": "nine",
-    }
-    m = re.search(r"^\d+", string)
+    m = _LEADING_DIGITS.search(string)
     if m:
         digitstring = string[0 : m.end()]
-        for key, val in digitdict.items():
+        for key, val in _DIGIT_NAMES.items():
             digitstring = digitstring.replace(key, val)
         string = digitstring + string[m.end() :]
 
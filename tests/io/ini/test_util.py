@@ -1,10 +1,157 @@
+import gc
+from enum import Enum
 from typing import Dict, List, Optional
 
 import pytest
 from pydantic.error_wrappers import ValidationError
+from pydantic.fields import Field
 
 from hydrolib.core.io.ini.models import INIBasedModel
-from hydrolib.core.io.ini.util import get_number_of_coordinates_validator
+from hydrolib.core.io.ini.util import (
+    get_enum_validator,
+    get_from_subclass_defaults,
+    get_number_of_coordinates_validator,
+    get_split_string_on_delimiter_validator,
+)
+
+
+class DummyEnum(str, Enum):
+    first = "firstValue"
+    second = "secondValue"
+
+
+class TestEnumValidator:
+    class DummyModel(INIBasedModel):
+        """Dummy model to test the case-insensitive enum validation."""
+
+        single: Optional[DummyEnum]
+        multiple: Optional[List[DummyEnum]]
+
+        _enum_validator = get_enum_validator("single", "multiple", enum=DummyEnum)
+
+    @pytest.mark.parametrize("value", ["firstValue", "firstvalue", "FIRSTVALUE"])
+    def test_value_is_matched_case_insensitively(self, value: str):
+        model = TestEnumValidator.DummyModel(single=value)
+
+        assert model.single == DummyEnum.first
+
+    def test_each_list_item_is_matched(self):
+        model = TestEnumValidator.DummyModel(multiple=["SecondValue", "firstvalue"])
+
+        assert model.multiple == [DummyEnum.second, DummyEnum.first]
+
+    def test_unknown_value_throws_validation_error(self):
+        with pytest.raises(ValidationError):
+            TestEnumValidator.DummyModel(single="thirdValue")
+
+    def test_same_arguments_return_same_validator(self):
+        first = get_enum_validator("single", enum=DummyEnum)
+        second = get_enum_validator("single", enum=DummyEnum)
+
+        assert first is second
+
+
+class TestGetFromSubclassDefaults:
+    class BaseDummyModel(INIBasedModel):
+        type: str
+
+    class FirstDummyModel(BaseDummyModel):
+        type: str = "firstType"
+
+    class SecondDummyModel(BaseDummyModel):
+        type: str = "secondType"
+
+    @pytest.mark.parametrize("value", ["firstType", "firsttype", "FIRSTTYPE"])
+    def test_matching_default_is_returned(self, value: str):
+        result = get_from_subclass_defaults(
+            TestGetFromSubclassDefaults.BaseDummyModel, "type", value
+        )
+
+        assert result == "firstType"
+
+    def test_unknown_value_is_returned_as_is(self):
+        result = get_from_subclass_defaults(
+            TestGetFromSubclassDefaults.BaseDummyModel, "type", "thirdType"
+        )
+
+        assert result == "thirdType"
+
+    def test_subclass_defined_later_is_found(self):
+        base = TestGetFromSubclassDefaults.BaseDummyModel
+        assert get_from_subclass_defaults(base, "type", "latetype") == "latetype"
+
+        class LateDummyModel(base):
+            type: str = "lateType"
+
+        assert get_from_subclass_defaults(base, "type", "latetype") == "lateType"
+
+    def test_subclass_replaced_by_another_is_found(self):
+        class ReplacedBaseDummyModel(INIBasedModel):
+            type: str
+
+        class AlphaDummyModel(ReplacedBaseDummyModel):
+            type: str = "alphaType"
+
+        base = ReplacedBaseDummyModel
+        assert get_from_subclass_defaults(base, "type", "alphatype") == "alphaType"
+
+        del AlphaDummyModel
+        gc.collect()
+
+        class BetaDummyModel(base):
+            type: str = "betaType"
+
+        assert get_from_subclass_defaults(base, "type", "betatype") == "betaType"
+
+
+class TestSplitStringOnDelimiterValidator:
+    class DummyModel(INIBasedModel):
+        """Dummy model to test the splitting of strings into lists."""
+
+        defaultlist: Optional[List[str]]
+        customlist: Optional[List[str]] = Field(None, delimiter=";")
+
+        _split_to_list = get_split_string_on_delimiter_validator(
+            "defaultlist", "customlist"
+        )
+
+    def test_string_is_split_on_default_delimiter(self):
+        model = TestSplitStringOnDelimiterValidator.DummyModel(defaultlist="a b  c")
+
+        assert model.defaultlist == ["a", "b", "c"]
+
+    def test_string_is_split_on_custom_field_delimiter(self):
+        model = TestSplitStringOnDelimiterValidator.DummyModel(customlist="a b;c d")
+
+        assert model.customlist == ["a b", "c d"]
+
+    def test_repeated_validation_uses_same_delimiters(self):
+        for _ in range(2):
+            model = TestSplitStringOnDelimiterValidator.DummyModel(
+                defaultlist="a b", customlist="c;d"
+            )
+
+            assert model.defaultlist == ["a", "b"]
+            assert model.customlist == ["c", "d"]
+
+    def test_list_value_is_not_changed(self):
+        model = TestSplitStringOnDelimiterValidator.DummyModel(defaultlist=["a b"])
+
+        assert model.defaultlist == ["a b"]
+
+    def test_reused_validator_works_in_other_model(self):
+        class OtherDummyModel(INIBasedModel):
+            defaultlist: Optional[List[str]]
+            customlist: Optional[List[str]] = Field(None, delimiter=";")
+
+            _split_to_list = get_split_string_on_delimiter_validator(
+                "defaultlist", "customlist"
+            )
+
+        model = OtherDummyModel(defaultlist="a b", customlist="c;d")
+
+        assert model.defaultlist == ["a", "b"]
+        assert model.customlist == ["c", "d"]
 
 
 class TestCoordinatesValidator:
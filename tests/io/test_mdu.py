@@ -3,13 +3,15 @@ from typing import Callable, Dict, Union
 
 import pytest
 
-from hydrolib.core.basemodel import DiskOnlyFileModel
+from hydrolib.core.basemodel import DiskOnlyFileModel, ResolveRelativeMode
 from hydrolib.core.io.mdu.models import (
     FMModel,
     InfiltrationMethod,
     Output,
     ParticlesThreeDType,
     ProcessFluxIntegration,
+    Restart,
+    Sediment,
     VegetationModelNr,
 )
 
@@ -91,3 +93,57 @@ class TestModels:
         assert model.crsfile is not None
         assert len(model.crsfile) == 1
         assert isinstance(model.crsfile[0], DiskOnlyFileModel)
+
+    def test_default_disk_only_file_models_are_empty_and_not_shared(self):
+        first = Output()
+        second = Output()
+
+        assert first.hisfile == DiskOnlyFileModel(None)
+        assert first.hisfile.filepath is None
+        assert first.hisfile is not second.hisfile
+        assert first.hisfile is not first.mapfile
+
+        first.hisfile.filepath = Path("output_his.nc")
+
+        assert second.hisfile.filepath is None
+
+    def test_none_disk_only_file_models_are_replaced_in_each_section(self):
+        sediment = Sediment(morfile=None)
+        restart = Restart(restartfile=None)
+
+        assert sediment.morfile == DiskOnlyFileModel(None)
+        assert restart.restartfile == DiskOnlyFileModel(None)
+
+    @pytest.mark.parametrize(
+        "data, expected_mode",
+        [
+            ({}, ResolveRelativeMode.ToParent),
+            ({"general": None}, ResolveRelativeMode.ToParent),
+            ({"general": {}}, ResolveRelativeMode.ToParent),
+            (
+                {"general": {"pathsrelativetoparent": None}},
+                ResolveRelativeMode.ToParent,
+            ),
+            ({"general": {"pathsrelativetoparent": "1"}}, ResolveRelativeMode.ToParent),
+            ({"general": {"pathsrelativetoparent": "0"}}, ResolveRelativeMode.ToAnchor),
+        ],
+    )
+    def test_get_relative_mode_from_data(
+        self, data: Dict, expected_mode: ResolveRelativeMode
+    ):
+        assert FMModel._get_relative_mode_from_data(data) == expected_mode
+
+    @pytest.mark.parametrize(
+        "paths_relative_to_parent, expected_mode",
+        [
+            (True, ResolveRelativeMode.ToParent),
+            (False, ResolveRelativeMode.ToAnchor),
+        ],
+    )
+    def test_relative_mode_follows_paths_relative_to_parent(
+        self, paths_relative_to_parent: bool, expected_mode: ResolveRelativeMode
+    ):
+        model = FMModel()
+        model.general.pathsrelativetoparent = paths_relative_to_parent
+
+        assert model._relative_mode == expected_mode